@@ -6,8 +6,10 @@ Main entry point for United Voice Agent
 import sys
 import os
 
-# Add src to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add project root to Python path (running the script already puts it there)
+project_root = os.path.dirname(os.path.abspath(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from src.core.voice_agent import main
 
@@ -5,6 +5,7 @@ Health check endpoints for production monitoring
 import os
 import json
 import asyncio
+import aiohttp
 from datetime import datetime
 from typing import Dict, Any
 from fastapi import APIRouter, HTTPException, status
@@ -34,11 +35,16 @@ async def check_groq_health() -> Dict[str, Any]:
         from groq import Groq
         client = Groq(api_key=settings.groq.api_key)
         
-        # Test with a minimal completion request
-        response = client.chat.completions.create(
-            messages=[{"role": "user", "content": "health check"}],
-            model="gemma2-9b-it",
-            max_tokens=5
+        # Test with a minimal completion request. The SDK call blocks, so run
+        # it in a thread pool to let the other checks proceed concurrently
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(
+            None,
+            lambda: client.chat.completions.create(
+                messages=[{"role": "user", "content": "health check"}],
+                model="gemma2-9b-it",
+                max_tokens=5
+            )
         )
         
         return {"status": "healthy", "model": "gemma2-9b-it"}
@@ -55,8 +61,9 @@ async def check_elevenlabs_health() -> Dict[str, Any]:
         from elevenlabs import voices, set_api_key
         set_api_key(settings.elevenlabs.api_key)
         
-        # Try to fetch voices (lightweight API call)
-        voice_list = voices()
+        # Try to fetch voices (lightweight, but blocking, API call)
+        loop = asyncio.get_event_loop()
+        voice_list = await loop.run_in_executor(None, voices)
         return {
             "status": "healthy", 
             "voices_available": len(voice_list.voices) if voice_list else 0
@@ -71,19 +78,18 @@ async def check_serpapi_health() -> Dict[str, Any]:
         if not settings or not settings.serpapi.api_key:
             return {"status": "unhealthy", "error": "API key not configured"}
         
-        import requests
-        
         # Make a simple request to check API availability
-        response = requests.get(
-            "https://serpapi.com/account",
-            params={"api_key": settings.serpapi.api_key},
-            timeout=10
-        )
-        
-        if response.status_code == 200:
-            return {"status": "healthy", "credits": response.json().get("total_searches_left", "unknown")}
-        else:
-            return {"status": "unhealthy", "error": f"HTTP {response.status_code}"}
+        async with aiohttp.ClientSession() as session:
+            async with session.get(
+                "https://serpapi.com/account",
+                params={"api_key": settings.serpapi.api_key},
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return {"status": "healthy", "credits": data.get("total_searches_left", "unknown")}
+                else:
+                    return {"status": "unhealthy", "error": f"HTTP {response.status}"}
     except Exception as e:
         return {"status": "unhealthy", "error": str(e)}
 
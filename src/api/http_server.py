@@ -5,6 +5,7 @@ Provides REST API support alongside WebSocket functionality
 """
 
 import base64
+import binascii
 import logging
 import tempfile
 import os
@@ -246,7 +247,7 @@ async def synthesize_speech(request: TTSRequest):
             raise HTTPException(status_code=500, detail="Failed to generate audio")
         
         # Convert to base64
-        audio_base64 = base64.b64encode(audio_bytes).decode('utf-8')
+        audio_base64 = binascii.b2a_base64(audio_bytes, newline=False).decode('ascii')
         
         return TTSResponse(
             audio=audio_base64,
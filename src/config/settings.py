@@ -16,27 +16,28 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
 # Safe import with fallback for environment loader
 try:
     from ..utils.env_loader import (
         load_groq_api_key,
         load_elevenlabs_api_key, 
         load_serpapi_key,
-        validate_api_keys
+        validate_api_keys,
+        is_managed_platform
     )
 except ImportError:
     # Fallback for when running from different contexts
     import sys
-    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+    src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+    if src_dir not in sys.path:
+        sys.path.append(src_dir)
     try:
         from utils.env_loader import (
             load_groq_api_key,
             load_elevenlabs_api_key,
             load_serpapi_key, 
-            validate_api_keys
+            validate_api_keys,
+            is_managed_platform
         )
     except ImportError:
         # Ultimate fallback - define basic functions
@@ -49,15 +50,23 @@ except ImportError:
         def load_serpapi_key() -> Optional[str]:
             return os.getenv('SERPAPI_API_KEY')
         
-        def validate_api_keys() -> List[str]:
-            issues = []
-            if not load_groq_api_key():
-                issues.append("GROQ_API_KEY missing")
-            if not load_elevenlabs_api_key():
-                issues.append("ELEVENLABS_API_KEY missing")
-            if not load_serpapi_key():
-                issues.append("SERPAPI_API_KEY missing")
-            return issues
+        def validate_api_keys(keys: Optional[Dict[str, Optional[str]]] = None) -> List[str]:
+            if keys is None:
+                keys = {
+                    "GROQ_API_KEY": load_groq_api_key(),
+                    "ELEVENLABS_API_KEY": load_elevenlabs_api_key(),
+                    "SERPAPI_API_KEY": load_serpapi_key(),
+                }
+            return [f"{name} missing" for name, value in keys.items() if not value]
+        
+        def is_managed_platform() -> bool:
+            # Platform detection unavailable; always read .env
+            return False
+
+# Load environment variables from .env file, unless a deployment platform
+# (Railway, Heroku, Vercel, Docker) has already populated the environment
+if not is_managed_platform():
+    load_dotenv()
 
 logger = logging.getLogger(__name__)
 
@@ -298,7 +307,11 @@ class Settings:
         serpapi_key = load_serpapi_key()
         
         # Validate API keys and collect issues
-        validation_issues = validate_api_keys()
+        validation_issues = validate_api_keys({
+            "GROQ_API_KEY": groq_key,
+            "ELEVENLABS_API_KEY": elevenlabs_key,
+            "SERPAPI_API_KEY": serpapi_key,
+        })
         if validation_issues:
             logger.warning(f"API key validation issues: {', '.join(validation_issues)}")
         
@@ -1364,8 +1364,6 @@ class BookingFlow:
     
     def _correct_trip_type_mishearings(self, user_input: str) -> str:
         """Apply fuzzy matching and phonetic similarity to correct common trip type mishearings"""
-        import re  # Ensure re is available in this scope
-        
         # Common speech recognition mishearings for "round trip"
         round_trip_mishearings = {
             'phone trip': 'round trip',
@@ -1454,7 +1452,6 @@ class BookingFlow:
             (r'\b(?:one|won|when|on|own)\s+(?:day|wa[wy]|weigh|whey|bay|may)\b', 'one way'),
         ]
         
-        import re
         for pattern, correction in phonetic_patterns:
             if re.search(pattern, corrected_input, re.IGNORECASE):
                 corrected_input = re.sub(pattern, correction, corrected_input, flags=re.IGNORECASE)
@@ -93,6 +93,13 @@ class BookingValidator:
         "vancouver": ["YVR"]
     }
     
+    # Format patterns, compiled once for all validators
+    NAME_PATTERN = re.compile(r"^[a-zA-Z\s\-']+$")
+    MC_PREFIX_PATTERN = re.compile(r"\bMc([a-z])")
+    O_PREFIX_PATTERN = re.compile(r"\bO'([a-z])")
+    EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    NON_DIGIT_PATTERN = re.compile(r'\D')
+    
     def __init__(self):
         """Initialize the validator."""
         self.date_formats = [
@@ -384,7 +391,7 @@ class BookingValidator:
             )
         
         # Check for valid characters (letters, spaces, hyphens, apostrophes)
-        if not re.match(r"^[a-zA-Z\s\-']+$", name):
+        if not self.NAME_PATTERN.match(name):
             return ValidationResult(
                 is_valid=False,
                 error_message=f"{field_name.title()} contains invalid characters",
@@ -395,8 +402,8 @@ class BookingValidator:
         normalized_name = name.title()
         
         # Handle special cases like "McDonald", "O'Connor"
-        normalized_name = re.sub(r"\bMc([a-z])", r"Mc\1".title(), normalized_name)
-        normalized_name = re.sub(r"\bO'([a-z])", r"O'\1".title(), normalized_name)
+        normalized_name = self.MC_PREFIX_PATTERN.sub(r"Mc\1".title(), normalized_name)
+        normalized_name = self.O_PREFIX_PATTERN.sub(r"O'\1".title(), normalized_name)
         
         return ValidationResult(
             is_valid=True,
@@ -415,9 +422,7 @@ class BookingValidator:
         email = email.strip().lower()
         
         # Basic email regex
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        if not re.match(pattern, email):
+        if not self.EMAIL_PATTERN.match(email):
             return ValidationResult(
                 is_valid=False,
                 error_message="Invalid email format",
@@ -439,7 +444,7 @@ class BookingValidator:
             )
         
         # Remove all non-digit characters
-        digits_only = re.sub(r'\D', '', phone)
+        digits_only = self.NON_DIGIT_PATTERN.sub('', phone)
         
         # US phone number validation
         if len(digits_only) == 10:
@@ -14,6 +14,8 @@ Version: 2.0.0
 Python Version: 3.8+
 """
 
+import importlib.util
+import itertools
 import json
 import logging
 import os
@@ -21,18 +23,33 @@ import re
 import sys
 import time
 import wave
-from typing import Optional, Dict, Any, List
+from collections import deque
+from typing import Optional, Dict, Any, Deque
 
 try:
     import numpy as np
-    import sounddevice as sd
-    AUDIO_AVAILABLE = True
 except ImportError:
-    AUDIO_AVAILABLE = False
     np = None
-    sd = None
+
+# sounddevice loads PortAudio on import (raising OSError when the library is
+# missing), which the WebSocket server never needs; it is imported on first
+# recording instead, and only looked up here
+AUDIO_AVAILABLE = np is not None and importlib.util.find_spec("sounddevice") is not None
+if not AUDIO_AVAILABLE:
     logging.warning("Audio dependencies not available. Running in text-only mode.")
 
+_sounddevice = None
+
+
+def _get_sounddevice():
+    """Import sounddevice on first use and return the module"""
+    global _sounddevice
+    if _sounddevice is None:
+        import sounddevice
+        _sounddevice = sounddevice
+    return _sounddevice
+
+
 try:
     from elevenlabs import play as elevenlabs_play
     from elevenlabs.client import ElevenLabs
@@ -41,8 +58,6 @@ except ImportError:
     ElevenLabs = None
     logging.warning("ElevenLabs TTS not available.")
 
-from dotenv import load_dotenv
-
 from src.config.settings import settings
 from src.core.booking_flow import BookingFlow, BookingState
 from src.services.fallback_llm import FallbackLLMService
@@ -50,9 +65,6 @@ from src.services.fallback_transcription import EnhancedGroqWhisperClient as Gro
 from src.services.google_flights_api import GoogleFlightsAPI
 from src.services.groq_client import GroqClient
 
-# Load environment variables
-load_dotenv()
-
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -104,8 +116,11 @@ class UnitedVoiceAgent:
         # Initialize flight search API with error handling
         self.flight_api = self._initialize_flight_api()
         
-        # Initialize conversation state
-        self.conversation_history: List[Dict[str, str]] = []
+        # Initialize conversation state; the deque drops the oldest turns
+        # itself once the configured history length is reached
+        self.conversation_history: Deque[Dict[str, str]] = deque(
+            maxlen=settings.max_conversation_history
+        )
         
         # Audio configuration
         self.sample_rate = settings.whisper.sample_rate
@@ -339,11 +354,14 @@ Which one catches your eye?"""
         print(f"\nListening for {duration} seconds...")
         print("Speak now!")
         
+        sd = _get_sounddevice()
+        # Record 16-bit PCM directly; PortAudio converts samples in C, so no
+        # float buffer has to be scaled and cast before writing the WAV
         audio_data = sd.rec(
             int(duration * self.sample_rate),
             samplerate=self.sample_rate,
             channels=self.channels,
-            dtype=np.float32
+            dtype=np.int16
         )
         sd.wait()
         
@@ -364,7 +382,10 @@ Which one catches your eye?"""
         
         # Save audio temporarily
         temp_file = "temp_audio.wav"
-        audio_int16 = (audio_data * 32767).astype(np.int16)
+        if audio_data.dtype == np.int16:
+            audio_int16 = audio_data
+        else:
+            audio_int16 = (audio_data * 32767).astype(np.int16)
         
         with wave.open(temp_file, 'w') as wav_file:
             wav_file.setnchannels(self.channels)
@@ -558,7 +579,9 @@ Which one catches your eye?"""
         # Build comprehensive conversation context for LLM
         conversation_context = ""
         if len(self.conversation_history) > 2:  # Include recent history
-            recent_history = self.conversation_history[-6:]  # Last 3 exchanges for better context
+            # Last 3 exchanges for better context, read without copying the whole deque
+            history = self.conversation_history
+            recent_history = list(itertools.islice(history, max(0, len(history) - 6), None))
             conversation_context = "\n\nRecent conversation:\n"
             for i, msg in enumerate(recent_history):
                 role = "Customer" if msg["role"] == "user" else "Alex"
@@ -650,10 +673,6 @@ You're not just an assistant - you're a helpful human who loves making travel ea
         # Add assistant response to conversation history
         self.conversation_history.append({"role": "assistant", "content": response_text})
         
-        # Keep conversation history manageable (last 20 messages)
-        if len(self.conversation_history) > 20:
-            self.conversation_history = self.conversation_history[-20:]
-        
         return response_text
     
     def _get_fallback_response(self, user_input: str, booking_response: str, state_info: dict) -> str:
@@ -791,7 +810,7 @@ You're not just an assistant - you're a helpful human who loves making travel ea
         
         # Reset booking flow and conversation history
         self.booking_flow = BookingFlow()
-        self.conversation_history = []
+        self.conversation_history.clear()
         
         # Special handling for the first user input to detect trip information at greeting
         first_response = True
@@ -856,7 +875,7 @@ You're not just an assistant - you're a helpful human who loves making travel ea
         
         # Reset booking flow and conversation history
         self.booking_flow = BookingFlow()
-        self.conversation_history = []
+        self.conversation_history.clear()
         
         print("Running enhanced demo booking flow with intent recognition...")
         print("This demo showcases greeting with trip type, corrections, questions, and natural conversation.")
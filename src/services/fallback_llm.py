@@ -5,6 +5,7 @@ Provides basic but functional responses to keep the booking flow working
 """
 
 import random
+import re
 from typing import Dict, List
 from src.core.booking_flow import BookingState
 
@@ -187,7 +188,6 @@ def create_simple_llm_client(fallback_service: FallbackLLMService = None):
             context = {}
             if "Customer:" in system_message:
                 # Try to extract customer name
-                import re
                 name_match = re.search(r"Customer: ([^;,\n]+)", system_message)
                 if name_match:
                     context["customer_name"] = name_match.group(1).strip()
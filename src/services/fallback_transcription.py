@@ -4,15 +4,33 @@ Fallback transcription service for when Groq API is unavailable
 Provides mock transcription and user-friendly error handling
 """
 
+import io
 import os
 import time
+import tempfile
+import wave
 import logging
 import random
+from functools import lru_cache
 from typing import Optional, List
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
+def silent_probe_wav() -> bytes:
+    """0.1 seconds of 16 kHz mono silence as WAV bytes, built once per process"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        # 1600 zeroed 16-bit frames: 0.1 seconds at 16 kHz
+        wav_file.writeframes(bytes(3200))
+    return buffer.getvalue()
+
+
 @dataclass
 class TranscriptionResult:
     """Result from transcription service"""
@@ -24,6 +42,19 @@ class TranscriptionResult:
 class FallbackTranscriptionService:
     """Fallback service for when primary transcription fails"""
     
+    # Prompt keyword -> mock_booking_responses category, checked in order
+    CONTEXT_KEYWORDS = (
+        ("name", "name"),
+        ("where", "destination"),
+        ("destination", "destination"),
+        ("from", "origin"),
+        ("departing", "origin"),
+        ("when", "date"),
+        ("date", "date"),
+        ("option", "confirmation"),
+        ("flight", "confirmation"),
+    )
+    
     def __init__(self):
         self.mock_responses = [
             "I'd like to book a flight",
@@ -54,17 +85,12 @@ class FallbackTranscriptionService:
         # Context-aware mock responses
         if context:
             context_lower = context.lower()
-            
-            if "name" in context_lower:
-                text = random.choice(self.mock_booking_responses["name"])
-            elif "where" in context_lower or "destination" in context_lower:
-                text = random.choice(self.mock_booking_responses["destination"]) 
-            elif "from" in context_lower or "departing" in context_lower:
-                text = random.choice(self.mock_booking_responses["origin"])
-            elif "when" in context_lower or "date" in context_lower:
-                text = random.choice(self.mock_booking_responses["date"])
-            elif "option" in context_lower or "flight" in context_lower:
-                text = random.choice(self.mock_booking_responses["confirmation"])
+            category = next(
+                (category for keyword, category in self.CONTEXT_KEYWORDS if keyword in context_lower),
+                None
+            )
+            if category:
+                text = random.choice(self.mock_booking_responses[category])
             else:
                 text = random.choice(self.mock_responses)
         else:
@@ -81,6 +107,18 @@ class FallbackTranscriptionService:
             timestamp=time.time()
         )
     
+    def get_mock_transcriptions(self, contexts: List[str]) -> List[TranscriptionResult]:
+        """
+        Generate mock transcriptions for several prompts in one call
+        
+        Args:
+            contexts: Prompts to answer, in order
+            
+        Returns:
+            One TranscriptionResult per context
+        """
+        return [self.get_mock_transcription(context) for context in contexts]
+    
     def get_user_input_transcription(self, prompt: str = "Please type what you said: ") -> TranscriptionResult:
         """Get transcription via text input when voice fails"""
         try:
@@ -135,30 +173,14 @@ class EnhancedGroqWhisperClient:
     def _test_groq_connection(self) -> bool:
         """Test if Groq API is working"""
         try:
-            import wave
-            import tempfile
-            
-            # Create minimal test audio
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                with wave.open(tmp_file.name, 'w') as wav_file:
-                    wav_file.setnchannels(1)
-                    wav_file.setsampwidth(2)
-                    wav_file.setframerate(16000)
-                    wav_file.writeframes(b'\x00\x00' * 1600)  # 0.1 seconds of silence
-                
-                tmp_path = tmp_file.name
-            
-            try:
-                with open(tmp_path, "rb") as audio_file:
-                    response = self.client.audio.transcriptions.create(
-                        model=self.model,
-                        file=audio_file,
-                        language="en",
-                        response_format="text"
-                    )
-                return True
-            finally:
-                os.unlink(tmp_path)
+            # Minimal test audio, sent straight from memory
+            self.client.audio.transcriptions.create(
+                model=self.model,
+                file=("probe.wav", silent_probe_wav()),
+                language="en",
+                response_format="text"
+            )
+            return True
                 
         except Exception as e:
             logger.error(f"Groq connection test failed: {e}")
@@ -236,7 +258,6 @@ class EnhancedGroqWhisperClient:
         """Transcribe audio bytes with fallbacks"""
         
         # Save to temporary file
-        import tempfile
         with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
             tmp_file.write(audio_bytes)
             tmp_path = tmp_file.name
@@ -311,6 +332,6 @@ if __name__ == "__main__":
     
     # Test mock transcription
     print("\n🎭 Testing mock transcription...")
-    for context in ["What's your name?", "Where are you flying to?", "When do you want to travel?"]:
-        mock_result = client.fallback_service.get_mock_transcription(context)
+    contexts = ["What's your name?", "Where are you flying to?", "When do you want to travel?"]
+    for context, mock_result in zip(contexts, client.fallback_service.get_mock_transcriptions(contexts)):
         print(f"Context: '{context}' -> Mock: '{mock_result.text}'")
\ No newline at end of file
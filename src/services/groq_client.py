@@ -27,6 +27,10 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+class CircuitOpenError(requests.RequestException):
+    """Raised when the circuit breaker rejects a request without sending it"""
+
+
 class GroqClient:
     """
     Client for Groq API providing fast LLM inference.
@@ -38,6 +42,8 @@ class GroqClient:
         api_key: Authentication key for Groq API
         base_url: Base URL for Groq API endpoints
         headers: HTTP headers for API requests
+        session: Pooled HTTP session reused across requests
+        failure_count: Consecutive failed requests counted by the circuit breaker
         models: Available model configurations
         default_model: Default model identifier
         
@@ -51,6 +57,11 @@ class GroqClient:
     DEFAULT_TIMEOUT = 30  # seconds
     DEFAULT_MAX_TOKENS = 1024
     
+    # Circuit breaker: after this many consecutive failures, requests fail
+    # immediately until the cool-down has passed and one trial call succeeds
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_RESET_TIMEOUT = 30  # seconds
+    
     # Available Groq models with their capabilities
     AVAILABLE_MODELS = {
         "gemma2-9b": {
@@ -98,6 +109,13 @@ class GroqClient:
             "User-Agent": "UnitedVoiceAgent/2.0.0"
         }
         
+        # Keep-alive session so successive turns reuse the TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
+        self.failure_count = 0
+        self._circuit_opened_at: Optional[float] = None
+        
         # Use Gemma 2 9B as default for tool calling capabilities
         self.default_model = "gemma2-9b-it"
         
@@ -125,6 +143,7 @@ class GroqClient:
             Dictionary containing response message, usage stats, and model info
             
         Raises:
+            CircuitOpenError: If the circuit breaker is open after repeated failures
             requests.RequestException: If API request fails
             ValueError: If input parameters are invalid
         """
@@ -151,23 +170,25 @@ class GroqClient:
             "max_tokens": max_tokens,
         }
         
-        start_time = time.time()
+        self._check_circuit()
+        
+        start_time = time.monotonic()
         
         try:
             logger.debug(f"Sending chat completion request to Groq (model: {model})")
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/chat/completions",
-                headers=self.headers,
                 json=payload,
                 timeout=timeout
             )
             response.raise_for_status()
             
             result = response.json()
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.monotonic() - start_time
             
             logger.debug(f"Chat completion successful in {elapsed_time:.2f}s")
+            self._record_success()
             
             # Extract response data
             choice = result["choices"][0]
@@ -184,17 +205,65 @@ class GroqClient:
             
         except requests.Timeout:
             logger.error(f"Groq API request timed out after {timeout} seconds")
+            self._record_failure()
             raise
         except requests.HTTPError as e:
             logger.error(f"Groq API HTTP error: {e.response.status_code} - {e.response.text}")
+            # Only rate limiting and server-side errors indicate a degraded
+            # service; other 4xx responses are problems with this request
+            if e.response.status_code == 429 or e.response.status_code >= 500:
+                self._record_failure()
             raise
         except requests.RequestException as e:
             logger.error(f"Groq API request failed: {e}")
+            self._record_failure()
             raise
         except (KeyError, IndexError) as e:
             logger.error(f"Unexpected Groq API response format: {e}")
             raise ValueError(f"Invalid API response format: {e}")
     
+    def _check_circuit(self) -> None:
+        """
+        Reject the request while the circuit is open.
+        
+        Once the reset timeout has elapsed a single trial request is let
+        through; its outcome closes the circuit again or restarts the timer.
+        
+        Raises:
+            CircuitOpenError: If the circuit is open and still cooling down
+        """
+        if self._circuit_opened_at is None:
+            return
+        
+        remaining = self.CIRCUIT_RESET_TIMEOUT - (time.monotonic() - self._circuit_opened_at)
+        if remaining > 0:
+            raise CircuitOpenError(
+                f"Groq API circuit open after {self.failure_count} consecutive failures; "
+                f"retrying in {remaining:.0f}s"
+            )
+        
+        # Half-open: restart the timer so concurrent callers keep failing fast
+        # while the trial request is in flight
+        self._circuit_opened_at = time.monotonic()
+    
+    def _record_success(self) -> None:
+        """Close the circuit after a successful request"""
+        if self._circuit_opened_at is not None:
+            logger.info("Groq API recovered, closing circuit")
+        self.failure_count = 0
+        self._circuit_opened_at = None
+    
+    def _record_failure(self) -> None:
+        """Count a failed request and open the circuit at the threshold"""
+        self.failure_count += 1
+        if self.failure_count >= self.CIRCUIT_FAILURE_THRESHOLD:
+            if self._circuit_opened_at is None:
+                logger.warning(
+                    f"Groq API failed {self.failure_count} times in a row, "
+                    f"opening circuit for {self.CIRCUIT_RESET_TIMEOUT}s"
+                )
+            self._circuit_opened_at = time.monotonic()
+    
     def test_connection(self) -> Tuple[bool, str]:
         """
         Test the connection to Groq API.
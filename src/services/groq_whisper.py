@@ -9,6 +9,8 @@ from typing import Optional, Dict, Any
 from groq import Groq
 import logging
 
+from src.services.fallback_transcription import silent_probe_wav
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,19 +66,16 @@ class GroqWhisperClient:
             Transcribed text
         """
         try:
-            # Save to temporary file (Groq API requires file-like object)
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                tmp_file.write(audio_bytes)
-                tmp_path = tmp_file.name
+            # The API accepts a (filename, bytes) tuple, so no temp file is needed
+            response = self.client.audio.transcriptions.create(
+                model=self.model,
+                file=(filename, audio_bytes),
+                language=language,
+                response_format="text"
+            )
             
-            try:
-                # Transcribe using file path
-                result = self.transcribe_audio_file(tmp_path, language)
-                return result
-            finally:
-                # Clean up temporary file
-                os.unlink(tmp_path)
+            # Response is directly the transcribed text
+            return response.strip()
                 
         except Exception as e:
             logger.error(f"Groq Whisper transcription error: {e}")
@@ -85,27 +84,10 @@ class GroqWhisperClient:
     def test_connection(self) -> bool:
         """Test Groq Whisper API connection"""
         try:
-            # Create a tiny silent audio file for testing
-            import wave
-            import tempfile
-            
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                with wave.open(tmp_file.name, 'w') as wav_file:
-                    wav_file.setnchannels(1)
-                    wav_file.setsampwidth(2)
-                    wav_file.setframerate(16000)
-                    # Write 0.1 seconds of silence
-                    wav_file.writeframes(b'\x00\x00' * 1600)
-                
-                tmp_path = tmp_file.name
-            
-            try:
-                # Try to transcribe the silent audio
-                result = self.transcribe_audio_file(tmp_path, "en")
-                logger.info(f"Groq Whisper test successful. Result: '{result}'")
-                return True
-            finally:
-                os.unlink(tmp_path)
+            # Try to transcribe a tiny silent WAV
+            result = self.transcribe_audio_bytes(silent_probe_wav(), "test.wav", "en")
+            logger.info(f"Groq Whisper test successful. Result: '{result}'")
+            return True
                 
         except Exception as e:
             logger.error(f"Groq Whisper test failed: {e}")
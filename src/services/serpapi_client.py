@@ -8,6 +8,7 @@ import os
 import json
 import logging
 import asyncio
+import random
 import aiohttp
 from typing import Dict, Optional, List, Any
 from dataclasses import dataclass
@@ -89,10 +90,12 @@ class SerpApiClient:
         # Build query parameters
         query_params = self._build_query_params(params)
         
-        # Perform search with retry logic
-        for attempt in range(self.max_retries):
-            try:
-                async with aiohttp.ClientSession() as session:
+        # Perform search with retry logic. One session serves every attempt so
+        # retries reuse the pooled connection; it is scoped to this call because
+        # callers may drive each search on a fresh event loop
+        async with aiohttp.ClientSession() as session:
+            for attempt in range(self.max_retries):
+                try:
                     async with session.get(
                         self.base_url,
                         params=query_params,
@@ -116,18 +119,20 @@ class SerpApiClient:
                         
                         return data
                         
-            except aiohttp.ClientTimeout:
-                logger.warning(f"Request timeout on attempt {attempt + 1}")
-                if attempt == self.max_retries - 1:
-                    raise NetworkError("Request timed out after retries")
+                except asyncio.TimeoutError:
+                    logger.warning(f"Request timeout on attempt {attempt + 1}")
+                    if attempt == self.max_retries - 1:
+                        raise NetworkError("Request timed out after retries")
                     
-            except aiohttp.ClientError as e:
-                logger.warning(f"Network error on attempt {attempt + 1}: {e}")
-                if attempt == self.max_retries - 1:
-                    raise NetworkError(f"Network error: {str(e)}")
-            
-            # Exponential backoff
-            await asyncio.sleep(self.retry_delay * (2 ** attempt))
+                except aiohttp.ClientError as e:
+                    logger.warning(f"Network error on attempt {attempt + 1}: {e}")
+                    if attempt == self.max_retries - 1:
+                        raise NetworkError(f"Network error: {str(e)}")
+                
+                # Exponential backoff with jitter so concurrent searches that
+                # failed together do not retry in lockstep
+                backoff = self.retry_delay * (2 ** attempt)
+                await asyncio.sleep(backoff / 2 + random.uniform(0, backoff / 2))
         
         raise NetworkError("Failed after maximum retries")
     
@@ -5,6 +5,7 @@ Handles TTS using ElevenLabs API with fallback to pyttsx3
 """
 
 import os
+import re
 import logging
 import asyncio
 import tempfile
@@ -62,6 +63,13 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# pydub format names keyed by container magic bytes (AIFF is the Mac
+# pyttsx3 default even when asked for .wav); unknown headers auto-detect
+_CONTAINER_FORMATS = {
+    b'FORM': 'aiff',
+    b'RIFF': 'wav',
+}
+
 
 class MockTTSService:
     """Mock TTS service that always works without any dependencies"""
@@ -74,7 +82,6 @@ class MockTTSService:
     
     def _clean_text_for_speech(self, text: str) -> str:
         """Clean text for better speech synthesis"""
-        import re
         
         if not text:
             return text
@@ -222,7 +229,6 @@ class TTSService:
     
     def _clean_text_for_speech(self, text: str) -> str:
         """Clean text for better speech synthesis"""
-        import re
         
         if not text:
             return text
@@ -335,15 +341,9 @@ class TTSService:
                             with open(temp_wav_path, 'rb') as f:
                                 header = f.read(4)
                             
-                            if header == b'FORM':
-                                # AIFF format (Mac default)
-                                audio = AudioSegment.from_file(temp_wav_path, format="aiff")
-                            elif header == b'RIFF':
-                                # WAV format
-                                audio = AudioSegment.from_wav(temp_wav_path)
-                            else:
-                                # Try auto-detection
-                                audio = AudioSegment.from_file(temp_wav_path)
+                            audio = AudioSegment.from_file(
+                                temp_wav_path, format=_CONTAINER_FORMATS.get(header)
+                            )
                             
                             # Export to MP3
                             audio.export(temp_mp3_path, format="mp3", bitrate="128k")
@@ -7,11 +7,14 @@ Handles real-time audio streaming and voice conversation management
 import asyncio
 import json
 import base64
+import binascii
+import functools
 import logging
 import tempfile
 import os
 import re
-from typing import Dict, Any, Optional, Set
+import time
+from typing import Dict, Any, Optional, FrozenSet
 from datetime import datetime
 import wave
 import numpy as np
@@ -41,23 +44,38 @@ session_states: Dict[str, Dict[str, Any]] = {}
 recent_messages: Dict[str, Dict[str, Any]] = {}
 
 # Common Whisper hallucinations to filter out
-WHISPER_HALLUCINATIONS: Set[str] = {
+WHISPER_HALLUCINATIONS: FrozenSet[str] = frozenset({
     'thank you', 'thanks', 'thank', 'you', 'bye', 'goodbye', 
     'hello', 'hi', 'hey', 'oh', 'okay', 'ok', 'yes', 'no',
     'um', 'uh', 'ah', 'hmm', 'mmm', '.', '...', 
     'please', 'sorry', 'excuse me', 'pardon'
-}
+})
+
+# Subset the filter actually rejects on short transcriptions
+OBVIOUS_HALLUCINATIONS: FrozenSet[str] = frozenset({
+    'thank you', 'thanks', 'bye', 'goodbye', 'um', 'uh', 'ah', 'hmm'
+})
 
 # Minimum confidence threshold for accepting transcriptions - REDUCED for better responsiveness
 MIN_TRANSCRIPTION_CONFIDENCE = 0.4  # Reduced from 0.7
 MIN_TRANSCRIPTION_LENGTH = 2  # Reduced from 3 
 MAX_HALLUCINATION_LENGTH = 20  # Increased from 15
 
+# Patterns used by is_likely_hallucination, compiled once at import
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+# Same character class as PUNCTUATION_PATTERN restricted to ASCII, for str.translate
+ASCII_PUNCTUATION_TABLE = {
+    code: None for code in range(128) if PUNCTUATION_PATTERN.match(chr(code))
+}
+# Matches text holding more word characters than any rejection rule allows
+LONG_TEXT_PATTERN = re.compile(r'\W*(?:\w\W*){%d}' % (MAX_HALLUCINATION_LENGTH + 1))
+# Noise transcriptions: only punctuation and whitespace, or a filler word alone
+NOISE_PATTERN = re.compile(r'^(?:[\s\.\,\!\?]+|(?:uh|um|ah|mm|hmm)\s*)$', re.IGNORECASE)
+
 
 def is_duplicate_message(session_id: str, message_type: str, message_text: str) -> bool:
     """Check if this message is a duplicate and track it"""
-    import time
-    current_time = time.time()
+    current_time = time.monotonic()
     
     # Initialize session tracking if needed
     if session_id not in recent_messages:
@@ -91,6 +109,63 @@ def is_duplicate_message(session_id: str, message_type: str, message_text: str)
     return False
 
 
+@functools.lru_cache(maxsize=2048)
+def _hallucination_reason(text: str) -> Optional[str]:
+    """
+    Classify a non-blank transcription against the hallucination rules.
+    
+    Short utterances ("yes", "thanks", "uh") recur constantly, so verdicts
+    are cached; the caller does the logging so every rejection is still reported.
+    
+    Args:
+        text: Raw transcription text
+        
+    Returns:
+        Description of the rule that rejects the text, or None if it looks genuine
+    """
+    stripped = text.strip()
+    
+    # Fast path for ordinary sentences: once more than MAX_HALLUCINATION_LENGTH
+    # word characters are seen, none of the checks below can reject the text
+    if (len(stripped) > MAX_HALLUCINATION_LENGTH * 2 and stripped.isascii()
+            and LONG_TEXT_PATTERN.match(stripped)):
+        return None
+    
+    # Clean and normalize the text
+    cleaned_text = stripped.lower()
+    if cleaned_text.isascii():
+        cleaned_text = cleaned_text.translate(ASCII_PUNCTUATION_TABLE)
+    else:
+        cleaned_text = PUNCTUATION_PATTERN.sub('', cleaned_text)
+    
+    cleaned_length = len(cleaned_text)
+    
+    # Check if it's too short to be meaningful - MORE LENIENT
+    if cleaned_length < MIN_TRANSCRIPTION_LENGTH:
+        return "transcription (too short)"
+        
+    # Check if it's a short phrase that's likely a hallucination - MORE SELECTIVE 
+    if cleaned_length <= MAX_HALLUCINATION_LENGTH:
+        # Only check against most obvious hallucinations
+        if cleaned_text in OBVIOUS_HALLUCINATIONS:
+            return "obvious hallucination"
+            
+        # Check for single word obvious repetitions only
+        words = cleaned_text.split()
+        if len(words) == 1 and words[0] in OBVIOUS_HALLUCINATIONS:
+            return "single word obvious hallucination"
+            
+        # Only reject if it's exactly the same word repeated 3+ times
+        if len(words) >= 3 and len(set(words)) == 1 and words[0] in OBVIOUS_HALLUCINATIONS:
+            return "repeated obvious hallucination"
+    
+    # Check for patterns that indicate noise transcription - ONLY most obvious noise
+    if NOISE_PATTERN.match(cleaned_text):
+        return "noise pattern"
+    
+    return None
+
+
 class WebSocketVoiceAgent:
     """WebSocket-enabled voice agent for real-time communication"""
     
@@ -126,47 +201,13 @@ class WebSocketVoiceAgent:
     
     def is_likely_hallucination(self, text: str) -> bool:
         """Check if transcribed text is likely a Whisper hallucination - REDUCED filtering"""
-        if not text or len(text.strip()) == 0:
+        if not text or text.isspace():
             return True
-            
-        # Clean and normalize the text
-        cleaned_text = re.sub(r'[^\w\s]', '', text.lower().strip())
         
-        # Check if it's too short to be meaningful - MORE LENIENT
-        if len(cleaned_text) < MIN_TRANSCRIPTION_LENGTH:
-            logger.info(f"⚠️ Rejecting transcription (too short): '{text}'")
+        reason = _hallucination_reason(text)
+        if reason:
+            logger.info(f"⚠️ Rejecting {reason}: '{text}'")
             return True
-            
-        # Check if it's a short phrase that's likely a hallucination - MORE SELECTIVE 
-        if len(cleaned_text) <= MAX_HALLUCINATION_LENGTH:
-            # Only check against most obvious hallucinations
-            obvious_hallucinations = {'thank you', 'thanks', 'bye', 'goodbye', 'um', 'uh', 'ah', 'hmm'}
-            if cleaned_text in obvious_hallucinations:
-                logger.info(f"⚠️ Rejecting obvious hallucination: '{text}'")
-                return True
-                
-            # Check for single word obvious repetitions only
-            words = cleaned_text.split()
-            if len(words) == 1 and words[0] in obvious_hallucinations:
-                logger.info(f"⚠️ Rejecting single word obvious hallucination: '{text}'")
-                return True
-                
-            # Only reject if it's exactly the same word repeated 3+ times
-            if len(words) >= 3 and len(set(words)) == 1 and words[0] in obvious_hallucinations:
-                logger.info(f"⚠️ Rejecting repeated obvious hallucination: '{text}'")
-                return True
-        
-        # Check for patterns that indicate noise transcription - ONLY most obvious noise
-        noise_patterns = [
-            r'^[\s\.\,\!\?]+$',  # Only punctuation and whitespace
-            r'^(uh|um|ah|mm|hmm)\s*$',  # Common filler words alone
-        ]
-        
-        for pattern in noise_patterns:
-            if re.match(pattern, cleaned_text, re.IGNORECASE):
-                logger.info(f"⚠️ Rejecting noise pattern '{pattern}': '{text}'")
-                return True
-                
         return False
     
     async def transcribe_streaming_audio(self, audio_data: bytes, audio_format: str = 'webm') -> str:
@@ -272,12 +313,12 @@ async def audio_data(sid, data):
         
         voice_agent = voice_agents[sid]
         
-        # Extract audio data
-        audio_base64 = data.get('audio')
+        # Extract audio data (base64 string, or raw bytes sent as a binary attachment)
+        audio_payload = data.get('audio')
         audio_format = data.get('format', 'webm')
         timestamp = data.get('timestamp', datetime.utcnow().isoformat())
         
-        if not audio_base64:
+        if not audio_payload:
             await sio.emit('error', {'message': 'No audio data provided'}, room=sid)
             return
         
@@ -290,8 +331,11 @@ async def audio_data(sid, data):
             'message': 'Processing your audio...'
         }, room=sid)
         
-        # Decode base64 audio
-        audio_bytes = base64.b64decode(audio_base64)
+        # Binary attachments arrive as bytes and skip the base64 round trip
+        if isinstance(audio_payload, (bytes, bytearray)):
+            audio_bytes = bytes(audio_payload)
+        else:
+            audio_bytes = base64.b64decode(audio_payload)
         
         # Transcribe audio
         try:
@@ -375,7 +419,7 @@ async def audio_data(sid, data):
                     
                     if audio_bytes:
                         # Convert to base64 for transmission
-                        audio_data = base64.b64encode(audio_bytes).decode('utf-8')
+                        audio_data = binascii.b2a_base64(audio_bytes, newline=False).decode('ascii')
                         logger.info(f"TTS generated successfully, size: {len(audio_bytes)} bytes")
                     else:
                         logger.warning("TTS generation returned no audio")
@@ -472,6 +516,37 @@ async def health_check(sid):
     }, room=sid)
 
 
+@sio.event
+async def probe(sid, data=None):
+    """
+    Answer several status queries in one round trip
+    
+    Clients send {'checks': ['health', 'session_state']} and receive a single
+    'probe_response' instead of pairing health_check with get_session_state.
+    Omitting 'checks' returns both.
+    """
+    checks = data.get('checks') if isinstance(data, dict) else None
+    if not checks:
+        checks = ('health', 'session_state')
+    
+    response = {'timestamp': datetime.utcnow().isoformat()}
+    
+    if 'health' in checks:
+        response['health'] = {
+            'status': 'healthy',
+            'active_sessions': len(voice_agents)
+        }
+    
+    if 'session_state' in checks:
+        if sid in voice_agents:
+            response['session_state'] = voice_agents[sid].get_conversation_state()
+        else:
+            response['session_state'] = None
+            response['error'] = 'Session not found'
+    
+    await sio.emit('probe_response', response, room=sid)
+
+
 # Create ASGI app
 def create_websocket_app():
     """Create and configure the WebSocket ASGI application"""
@@ -12,14 +12,95 @@ Python Version: 3.8+
 """
 
 import calendar
+import functools
 import logging
 import re
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple, Union
+import time
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple, Union
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for the numeric parsing strategies
+_IN_DAYS_RE = re.compile(r'in (\d+) days?')
+_IN_WEEKS_RE = re.compile(r'in (\d+) weeks?')
+_IN_MONTHS_RE = re.compile(r'in (\d+) months?')
+_MM_DD_RE = re.compile(r'(\d{1,2})[/\-](\d{1,2})')
+
+# Fixed English month names for user-facing formatting (index 1-12)
+_MONTH_NAMES = (
+    '', 'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+# Fixed English weekday names indexed by datetime.weekday()
+_WEEKDAY_NAMES = (
+    'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'
+)
+
+
+def _fmt_month_day(dt: datetime) -> str:
+    """Format as "March 05", matching strftime("%B %d") without the locale lookup."""
+    return f"{_MONTH_NAMES[dt.month]} {dt.day:02d}"
+
+
+def _split_bare_month_day(text: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse text that is exactly "M/D", "MM-DD" etc. by digit position.
+    
+    Returns (month, day) as unvalidated ints, or None when the text has any
+    other shape so the caller falls back to the regex.
+    """
+    n = len(text)
+    if n < 3 or n > 5:
+        return None
+    
+    month = 0
+    i = 0
+    while i < n and '0' <= text[i] <= '9':
+        month = month * 10 + ord(text[i]) - 48
+        i += 1
+    if not 1 <= i <= 2 or text[i] not in '/-':
+        return None
+    
+    if not 1 <= n - i - 1 <= 2:
+        return None
+    day = 0
+    for ch in text[i + 1:]:
+        if not '0' <= ch <= '9':
+            return None
+        day = day * 10 + ord(ch) - 48
+    return month, day
+
+
+# Clock snapshot shared by parsers without a reference date, re-read once the
+# calendar day rolls over so every session uses the same cache key that day
+_clock_today: Optional[datetime] = None
+_clock_today_expires = 0.0
+
+
+def _current_today() -> datetime:
+    """Current datetime, captured once per calendar day for the whole process."""
+    global _clock_today, _clock_today_expires
+    if _clock_today is None or time.time() >= _clock_today_expires:
+        now = datetime.now()
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        _clock_today = now
+        _clock_today_expires = next_midnight.timestamp()
+    return _clock_today
+
+
+def _keyword_pattern(keywords) -> re.Pattern:
+    """
+    Compile keywords into one alternation, longest first.
+    
+    A single search reports the same hits as testing ``keyword in text``
+    for every keyword, but runs as one scan inside the regex engine.
+    """
+    return re.compile('|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
+
 
 class DateParser:
     """
@@ -44,6 +125,69 @@ class DateParser:
         holidays: Dictionary mapping holiday names to dates
     """
     
+    # Month name mappings with comprehensive variations
+    months: Mapping[str, int] = MappingProxyType({
+        'january': 1, 'jan': 1,
+        'february': 2, 'feb': 2,
+        'march': 3, 'mar': 3,
+        'april': 4, 'apr': 4,
+        'may': 5,
+        'june': 6, 'jun': 6,
+        'july': 7, 'jul': 7,
+        'august': 8, 'aug': 8,
+        'september': 9, 'sep': 9, 'sept': 9,
+        'october': 10, 'oct': 10,
+        'november': 11, 'nov': 11,
+        'december': 12, 'dec': 12
+    })
+    
+    # Weekday name mappings with variations
+    weekdays: Mapping[str, int] = MappingProxyType({
+        'monday': 0, 'mon': 0,
+        'tuesday': 1, 'tue': 1, 'tues': 1,
+        'wednesday': 2, 'wed': 2,
+        'thursday': 3, 'thu': 3, 'thur': 3, 'thurs': 3,
+        'friday': 4, 'fri': 4,
+        'saturday': 5, 'sat': 5,
+        'sunday': 6, 'sun': 6
+    })
+    
+    # Relative time expressions mapping
+    relative_days: Mapping[str, int] = MappingProxyType({
+        'today': 0,
+        'tomorrow': 1,
+        'day after tomorrow': 2,
+        'yesterday': -1  # Included for validation but filtered out
+    })
+    
+    # Holiday date mappings (month, day)
+    holidays: Mapping[str, Tuple[int, int]] = MappingProxyType({
+        'christmas': (12, 25),
+        'new year': (1, 1),
+        'new years': (1, 1),
+        'thanksgiving': (11, 24),  # Approximate - 4th Thursday varies
+        'july 4th': (7, 4),
+        'fourth of july': (7, 4),
+        'independence day': (7, 4),
+        'memorial day': (5, 30),  # Approximate
+        'labor day': (9, 7),  # Approximate
+    })
+    
+    # Single scan for "any holiday name occurs", so text without one is
+    # rejected without walking the table
+    _re_holidays = _keyword_pattern(holidays)
+    
+    # Keyword scanner replacing the per-weekday substring loop
+    _re_weekdays = _keyword_pattern(weekdays)
+    
+    # "march 15" or "15th of march" in one pattern
+    _months_alt = _keyword_pattern(months).pattern
+    _re_month_day = re.compile(
+        rf'(?P<month_a>{_months_alt})\s*(?P<day_a>\d{{1,2}})'
+        rf'|(?P<day_b>\d{{1,2}})\w*\s*(?:of\s*)?(?P<month_b>{_months_alt})'
+    )
+    del _months_alt
+    
     def __init__(self, reference_date: Optional[datetime] = None) -> None:
         """
         Initialize the date parser.
@@ -52,56 +196,53 @@ class DateParser:
             reference_date: Reference date for relative calculations.
                            Defaults to current datetime if not provided.
         """
-        self.today = reference_date or datetime.now()
+        # Without an explicit reference date, ``today`` follows the clock
+        self._reference_date = reference_date
+        self._capture_today()
         logger.debug(f"DateParser initialized with reference date: {self.today.strftime('%Y-%m-%d')}")
+    
+    @property
+    def today(self) -> datetime:
+        """
+        Reference datetime for relative calculations.
         
-        # Month name mappings with comprehensive variations
-        self.months: Dict[str, int] = {
-            'january': 1, 'jan': 1,
-            'february': 2, 'feb': 2,
-            'march': 3, 'mar': 3,
-            'april': 4, 'apr': 4,
-            'may': 5,
-            'june': 6, 'jun': 6,
-            'july': 7, 'jul': 7,
-            'august': 8, 'aug': 8,
-            'september': 9, 'sep': 9, 'sept': 9,
-            'october': 10, 'oct': 10,
-            'november': 11, 'nov': 11,
-            'december': 12, 'dec': 12
-        }
-        
-        # Weekday name mappings with variations
-        self.weekdays: Dict[str, int] = {
-            'monday': 0, 'mon': 0,
-            'tuesday': 1, 'tue': 1, 'tues': 1,
-            'wednesday': 2, 'wed': 2,
-            'thursday': 3, 'thu': 3, 'thur': 3, 'thurs': 3,
-            'friday': 4, 'fri': 4,
-            'saturday': 5, 'sat': 5,
-            'sunday': 6, 'sun': 6
-        }
-        
-        # Relative time expressions mapping
-        self.relative_days: Dict[str, int] = {
-            'today': 0,
-            'tomorrow': 1,
-            'day after tomorrow': 2,
-            'yesterday': -1  # Included for validation but filtered out
-        }
+        Returns the fixed reference date if one was given; otherwise the
+        current datetime, re-read only once the calendar day rolls over.
+        """
+        if self._reference_date is not None:
+            return self._reference_date
+        return _current_today()
+    
+    @today.setter
+    def today(self, value: datetime) -> None:
+        self._reference_date = value
+    
+    def _capture_today(self) -> None:
+        """Snapshot reference date fields so sub-parsers read plain attributes."""
+        today = self.today
+        self._today_ordinal = today.toordinal()
+        self._today_year = today.year
+        self._today_month = today.month
+        self._today_day = today.day
+    
+    def _future_dt(self, month: int, day: int) -> datetime:
+        """
+        Next occurrence of month/day on or after the reference date.
         
-        # Holiday date mappings (month, day)
-        self.holidays: Dict[str, Tuple[int, int]] = {
-            'christmas': (12, 25),
-            'new year': (1, 1),
-            'new years': (1, 1),
-            'thanksgiving': (11, 24),  # Approximate - 4th Thursday varies
-            'july 4th': (7, 4),
-            'fourth of july': (7, 4),
-            'independence day': (7, 4),
-            'memorial day': (5, 30),  # Approximate
-            'labor day': (9, 7),  # Approximate
-        }
+        Args:
+            month: Month number (1-12)
+            day: Day of month
+            
+        Returns:
+            Midnight datetime in the current or following year
+            
+        Raises:
+            ValueError: If the day does not exist in that month
+        """
+        year = self._today_year
+        if date(year, month, day).toordinal() < self._today_ordinal:
+            year += 1
+        return datetime(year, month, day)
     
     def parse(self, text: str) -> Optional[Tuple[datetime, str]]:
         """
@@ -120,68 +261,55 @@ class DateParser:
         if not isinstance(text, str):
             raise ValueError("Input must be a string")
             
-        if not text.strip():
+        text = text.strip()
+        if not text:
             logger.debug("Empty input text provided")
             return None
             
-        text = text.lower().strip()
-        logger.debug(f"Parsing date expression: '{text}'")
-        
-        # Try parsing strategies in order of specificity
-        parsing_strategies = [
-            self._parse_relative_days,
-            self._parse_in_x_days,
-            self._parse_weekday,
-            self._parse_month_day,
-            self._parse_date_formats,
-            self._parse_holidays,
-            self._parse_special_expressions
-        ]
-        
-        for strategy in parsing_strategies:
-            try:
-                result = strategy(text)
-                if result:
-                    logger.debug(f"Successfully parsed with {strategy.__name__}: {result[1]}")
-                    break
-            except Exception as e:
-                logger.warning(f"Error in {strategy.__name__}: {e}")
-                continue
-        else:
-            logger.debug(f"Failed to parse date expression: '{text}'")
-            return None
+        if not text.islower():
+            text = text.lower()
         
-        # Apply future date validation and adjustment
-        return self._validate_and_adjust_date(result)
+        # Results depend only on the text and the reference datetime, which
+        # stays fixed for a whole day, so repeated phrases hit the cache
+        return _parse_cached(text, self.today)
     
-    def _validate_and_adjust_date(self, result: Optional[Tuple[datetime, str]]) -> Optional[Tuple[datetime, str]]:
+    def _run_strategies(self, text: str) -> Optional[Tuple[datetime, str]]:
         """
-        Validate and adjust parsed date to ensure it's in the future.
+        Run the parsing strategies on normalized text.
         
         Args:
-            result: Parsing result tuple or None
+            text: Lower-cased, stripped date expression
             
         Returns:
-            Adjusted result tuple or None
+            Parsed date tuple or None
         """
-        if not result:
+        logger.debug(f"Parsing date expression: '{text}'")
+        
+        # Try parsing strategies in order of specificity. Each returns None
+        # rather than raising, so one guard covers the whole chain.
+        try:
+            result = (
+                self._parse_relative_days(text)
+                or self._parse_in_x_days(text)
+                or self._parse_weekday(text)
+                or self._parse_month_day(text)
+                or self._parse_date_formats(text)
+                or self._parse_holidays(text)
+                or self._parse_special_expressions(text)
+            )
+        except (ValueError, OverflowError) as e:
+            logger.warning(f"Error parsing date expression '{text}': {e}")
             return None
-            
-        date_obj, _ = result
         
-        # If date is in the past, adjust to next occurrence
-        if date_obj.date() < self.today.date():
-            logger.debug(f"Date {date_obj.date()} is in past, adjusting to future")
-            
-            # For dates in current year that have passed, try next year
-            if (date_obj.month < self.today.month or 
-                (date_obj.month == self.today.month and date_obj.day < self.today.day)):
-                
-                next_year_date = date_obj.replace(year=date_obj.year + 1)
-                formatted = next_year_date.strftime("%B %d, %Y")
-                logger.debug(f"Adjusted to next year: {formatted}")
-                return (next_year_date, formatted)
+        if not result:
+            logger.debug(f"Failed to parse date expression: '{text}'")
+            return None
         
+        logger.debug(f"Successfully parsed: {result[1]}")
+        # Sub-parsers already roll past dates forward; a past date here
+        # means a strategy is missing that step
+        if result[0].toordinal() < self._today_ordinal:
+            logger.warning(f"Parsed date {result[0].date()} for '{text}' is before the reference date")
         return result
     
     def _parse_relative_days(self, text: str) -> Optional[Tuple[datetime, str]]:
@@ -194,180 +322,161 @@ class DateParser:
         Returns:
             Parsed date tuple or None
         """
-        for phrase, days_offset in self.relative_days.items():
-            if phrase in text and days_offset >= 0:  # Exclude yesterday
-                target_date = self.today + timedelta(days=days_offset)
-                formatted = target_date.strftime("%B %d")
-                return (target_date, formatted)
-        return None
+        # Explicit checks, longest phrase first; yesterday is never returned
+        if 'today' in text:
+            days_offset = 0
+        elif 'tomorrow' in text:
+            days_offset = 2 if 'day after tomorrow' in text else 1
+        else:
+            return None
+        
+        target_date = self.today + timedelta(days=days_offset)
+        formatted = _fmt_month_day(target_date)
+        return (target_date, formatted)
     
     def _parse_in_x_days(self, text: str) -> Optional[Tuple[datetime, str]]:
         """Parse 'in X days/weeks/months' expressions"""
         # In X days
-        match = re.search(r'in (\d+) days?', text)
+        match = _IN_DAYS_RE.search(text)
         if match:
             days = int(match.group(1))
             target_date = self.today + timedelta(days=days)
-            return (target_date, target_date.strftime("%B %d"))
+            return (target_date, _fmt_month_day(target_date))
         
         # In X weeks
-        match = re.search(r'in (\d+) weeks?', text)
+        match = _IN_WEEKS_RE.search(text)
         if match:
             weeks = int(match.group(1))
             target_date = self.today + timedelta(weeks=weeks)
-            return (target_date, target_date.strftime("%B %d"))
+            return (target_date, _fmt_month_day(target_date))
         
         # In a week
         if 'in a week' in text or 'next week' in text:
             target_date = self.today + timedelta(weeks=1)
-            return (target_date, target_date.strftime("%B %d"))
+            return (target_date, _fmt_month_day(target_date))
         
         # In X months (approximate)
-        match = re.search(r'in (\d+) months?', text)
+        match = _IN_MONTHS_RE.search(text)
         if match:
             months = int(match.group(1))
             target_date = self.today + timedelta(days=months * 30)
-            return (target_date, target_date.strftime("%B %d"))
+            return (target_date, _fmt_month_day(target_date))
         
         return None
     
     def _parse_weekday(self, text: str) -> Optional[Tuple[datetime, str]]:
         """Parse weekday references (this Friday, next Monday, etc.)"""
-        for day_name, day_num in self.weekdays.items():
-            if day_name in text:
-                current_weekday = self.today.weekday()
-                days_until = (day_num - current_weekday) % 7
-                
-                # Handle this/next modifiers
-                if 'next' in text:
-                    days_until += 7
-                elif 'this' in text and days_until == 0:
-                    days_until = 7  # If today is the day, assume next week
-                elif days_until == 0:
-                    days_until = 7  # Default to next week if today
-                
-                target_date = self.today + timedelta(days=days_until)
-                return (target_date, target_date.strftime("%B %d"))
+        match = self._re_weekdays.search(text)
+        if not match:
+            return None
         
-        return None
+        day_num = self.weekdays[match.group()]
+        current_weekday = self.today.weekday()
+        days_until = (day_num - current_weekday) % 7
+        
+        # Handle this/next modifiers
+        if 'next' in text:
+            days_until += 7
+        elif 'this' in text and days_until == 0:
+            days_until = 7  # If today is the day, assume next week
+        elif days_until == 0:
+            days_until = 7  # Default to next week if today
+        
+        target_date = self.today + timedelta(days=days_until)
+        return (target_date, _fmt_month_day(target_date))
     
     def _parse_month_day(self, text: str) -> Optional[Tuple[datetime, str]]:
         """Parse month and day combinations"""
-        # Try month name + day
-        for month_name, month_num in self.months.items():
-            if month_name in text:
-                # Look for day number after month
-                pattern = rf'{month_name}\s*(\d{{1,2}})'
-                match = re.search(pattern, text)
-                if match:
-                    day = int(match.group(1))
-                    if 1 <= day <= 31:
-                        try:
-                            # Use current year initially
-                            year = self.today.year
-                            target_date = datetime(year, month_num, day)
-                            
-                            # If date is in past, use next year
-                            if target_date.date() < self.today.date():
-                                target_date = datetime(year + 1, month_num, day)
-                            
-                            return (target_date, target_date.strftime("%B %d"))
-                        except ValueError:
-                            pass  # Invalid day for month
-                
-                # Look for day number before month (e.g., "15th of March")
-                pattern = rf'(\d{{1,2}})\w*\s*(?:of\s*)?{month_name}'
-                match = re.search(pattern, text)
-                if match:
-                    day = int(match.group(1))
-                    if 1 <= day <= 31:
-                        try:
-                            year = self.today.year
-                            target_date = datetime(year, month_num, day)
-                            
-                            if target_date.date() < self.today.date():
-                                target_date = datetime(year + 1, month_num, day)
-                            
-                            return (target_date, target_date.strftime("%B %d"))
-                        except ValueError:
-                            pass
+        for match in self._re_month_day.finditer(text):
+            month_num = self.months[match.group('month_a') or match.group('month_b')]
+            day = int(match.group('day_a') or match.group('day_b'))
+            if 1 <= day <= 31:
+                try:
+                    target_date = self._future_dt(month_num, day)
+                    return (target_date, _fmt_month_day(target_date))
+                except ValueError:
+                    pass  # Invalid day for month
         
         return None
     
     def _parse_date_formats(self, text: str) -> Optional[Tuple[datetime, str]]:
         """Parse numeric date formats"""
-        # MM/DD or MM-DD
-        match = re.search(r'(\d{1,2})[/\-](\d{1,2})', text)
-        if match:
-            month, day = int(match.group(1)), int(match.group(2))
-            if 1 <= month <= 12 and 1 <= day <= 31:
-                try:
-                    year = self.today.year
-                    target_date = datetime(year, month, day)
-                    
-                    if target_date.date() < self.today.date():
-                        target_date = datetime(year + 1, month, day)
-                    
-                    return (target_date, target_date.strftime("%B %d"))
-                except ValueError:
-                    pass
+        # Bare "3/15" style input skips the regex entirely
+        parts = _split_bare_month_day(text)
+        if parts is None:
+            # MM/DD or MM-DD inside a longer phrase
+            match = _MM_DD_RE.search(text)
+            if not match:
+                return None
+            parts = int(match.group(1)), int(match.group(2))
+        
+        month, day = parts
+        if 1 <= month <= 12 and 1 <= day <= 31:
+            try:
+                target_date = self._future_dt(month, day)
+                return (target_date, _fmt_month_day(target_date))
+            except ValueError:
+                pass
         
         return None
     
     def _parse_holidays(self, text: str) -> Optional[Tuple[datetime, str]]:
         """Parse holiday references"""
+        if not self._re_holidays.search(text):
+            return None
+        
+        # Substring match in table order, so run-on phrases like
+        # "christmastime" still count and "new years" reports "New Year"
         for holiday, (month, day) in self.holidays.items():
             if holiday in text:
-                year = self.today.year
-                target_date = datetime(year, month, day)
-                
-                # If holiday passed this year, use next year
-                if target_date.date() < self.today.date():
-                    target_date = datetime(year + 1, month, day)
-                
+                target_date = self._future_dt(month, day)
                 holiday_name = holiday.title()
-                return (target_date, f"{holiday_name} ({target_date.strftime('%B %d')})")
+                return (target_date, f"{holiday_name} ({_fmt_month_day(target_date)})")
         
         return None
     
     def _parse_special_expressions(self, text: str) -> Optional[Tuple[datetime, str]]:
         """Parse special expressions like 'end of month', 'weekend', etc."""
+        # Every expression below mentions a week or a month
+        if 'week' not in text and 'month' not in text:
+            return None
+        
         # This weekend
         if 'this weekend' in text or 'the weekend' in text:
             days_until_saturday = (5 - self.today.weekday()) % 7
             if days_until_saturday == 0:
                 days_until_saturday = 7
             target_date = self.today + timedelta(days=days_until_saturday)
-            return (target_date, target_date.strftime("%B %d") + " (Saturday)")
+            return (target_date, _fmt_month_day(target_date) + " (Saturday)")
         
         # End of month
         if 'end of month' in text or 'end of the month' in text:
             # Get last day of current month
-            last_day = calendar.monthrange(self.today.year, self.today.month)[1]
-            target_date = datetime(self.today.year, self.today.month, last_day)
+            last_day = calendar.monthrange(self._today_year, self._today_month)[1]
+            target_date = datetime(self._today_year, self._today_month, last_day)
             
             # If we're already past the 25th, assume next month
-            if self.today.day > 25:
-                if self.today.month == 12:
-                    target_date = datetime(self.today.year + 1, 1, 31)
+            if self._today_day > 25:
+                if self._today_month == 12:
+                    target_date = datetime(self._today_year + 1, 1, 31)
                 else:
-                    next_month = self.today.month + 1
-                    last_day = calendar.monthrange(self.today.year, next_month)[1]
-                    target_date = datetime(self.today.year, next_month, last_day)
+                    next_month = self._today_month + 1
+                    last_day = calendar.monthrange(self._today_year, next_month)[1]
+                    target_date = datetime(self._today_year, next_month, last_day)
             
-            return (target_date, target_date.strftime("%B %d"))
+            return (target_date, _fmt_month_day(target_date))
         
         # Beginning of month
         if 'beginning of month' in text or 'start of month' in text:
-            if self.today.day > 15:  # If past mid-month, assume next month
-                if self.today.month == 12:
-                    target_date = datetime(self.today.year + 1, 1, 1)
+            if self._today_day > 1:  # The 1st has passed, assume next month
+                if self._today_month == 12:
+                    target_date = datetime(self._today_year + 1, 1, 1)
                 else:
-                    target_date = datetime(self.today.year, self.today.month + 1, 1)
+                    target_date = datetime(self._today_year, self._today_month + 1, 1)
             else:
-                target_date = datetime(self.today.year, self.today.month, 1)
+                target_date = datetime(self._today_year, self._today_month, 1)
             
-            return (target_date, target_date.strftime("%B %d"))
+            return (target_date, _fmt_month_day(target_date))
         
         return None
     
@@ -389,19 +498,19 @@ class DateParser:
             raise ValueError("Input must be a datetime object")
             
         try:
-            days_until = (date.date() - self.today.date()).days
+            today = self.today
+            days_until = date.toordinal() - today.toordinal()
             
             # Format based on relative distance
             if days_until == 0:
-                return "Today " + date.strftime("(%B %d)")
+                return f"Today ({_fmt_month_day(date)})"
             elif days_until == 1:
-                return "Tomorrow " + date.strftime("(%B %d)")
-            elif 2 <= days_until <= 14:
-                base_format = date.strftime("%A, %B %d")
-                return base_format + (f", %Y" if include_year or date.year != self.today.year else "")
-            else:
-                year_suffix = f", %Y" if include_year or date.year != self.today.year else ""
-                return date.strftime(f"%B %d{year_suffix}")
+                return f"Tomorrow ({_fmt_month_day(date)})"
+            
+            year_suffix = f", {date.year}" if include_year or date.year != today.year else ""
+            if 2 <= days_until <= 14:
+                return f"{_WEEKDAY_NAMES[date.weekday()]}, {_fmt_month_day(date)}{year_suffix}"
+            return f"{_fmt_month_day(date)}{year_suffix}"
                 
         except Exception as e:
             logger.error(f"Error formatting date {date}: {e}")
@@ -409,6 +518,25 @@ class DateParser:
             return date.strftime("%B %d, %Y")
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_cached(text: str, today: datetime) -> Optional[Tuple[datetime, str]]:
+    """
+    Parse normalized text against a fixed reference datetime.
+    
+    Module-level so the cache is shared by every DateParser and holds no
+    reference to any of them; a throwaway parser pinned to ``today`` runs
+    the strategies, so the result depends on the arguments alone.
+    
+    Args:
+        text: Lower-cased, stripped date expression
+        today: Reference datetime for relative calculations
+        
+    Returns:
+        Parsed date tuple or None
+    """
+    return DateParser(reference_date=today)._run_strategies(text)
+
+
 def main() -> None:
     """
     Test the date parser functionality.
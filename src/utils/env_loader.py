@@ -12,92 +12,174 @@ Python Version: 3.8+
 
 import logging
 import os
-from typing import Any, Dict, List, Optional, Tuple
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Placeholder fragments left in copied .env templates
+_PLACEHOLDER_RE = re.compile(r'YOUR_|PLACEHOLDER|REPLACE|EXAMPLE|INSERT|ADD_HERE', re.IGNORECASE)
 
-def load_env_var_robust(
-    var_name: str, 
-    prefixes: Optional[List[str]] = None,
-    case_sensitive: bool = True,
-    fallback_value: Optional[str] = None,
-    required: bool = False
-) -> Optional[str]:
+# Format rules per API key: (name, expected prefix, minimum length)
+_API_KEY_RULES = (
+    ("GROQ_API_KEY", "gsk_", 20),
+    ("ELEVENLABS_API_KEY", None, 20),
+    ("SERPAPI_API_KEY", None, 20),
+)
+
+# Default prefixes for Railway and common deployment platforms
+_DEFAULT_PREFIXES = (
+    '',           # No prefix (standard)
+    'RAILWAY_',   # Railway platform
+    'APP_',       # Generic app prefix
+    'SERVICE_',   # Service-specific
+    'BACKEND_',   # Backend-specific
+    'PRODUCTION_', # Production environment
+    'PROD_',      # Short production
+    'API_',       # API-specific
+    'ENV_',       # Environment prefix
+)
+
+
+@lru_cache(maxsize=1)
+def _env_snapshot() -> Dict[str, str]:
     """
-    Robust environment variable loader for Railway and other platforms
+    Plain-dict copy of os.environ, taken on first lookup.
     
-    Args:
-        var_name: Base variable name (e.g., 'GROQ_API_KEY')
-        prefixes: List of prefixes to try (e.g., ['RAILWAY_', 'APP_'])
-        case_sensitive: Whether to try case variations
-        fallback_value: Value to return if not found
-        required: Whether this variable is required (logs warning if missing)
+    Taken lazily rather than at import so that load_dotenv() calls made
+    before the first lookup are still picked up.
     
     Returns:
-        The environment variable value if found, fallback_value otherwise
+        Dictionary of environment variable names to values
+    """
+    return dict(os.environ)
+
+
+@lru_cache(maxsize=1)
+def _lower_env_snapshot() -> Tuple[Tuple[str, str, str], ...]:
     """
+    Snapshot non-empty environment variables for fuzzy key matching.
     
-    # Default prefixes for Railway and common deployment platforms
-    if prefixes is None:
-        prefixes = [
-            '',           # No prefix (standard)
-            'RAILWAY_',   # Railway platform
-            'APP_',       # Generic app prefix
-            'SERVICE_',   # Service-specific
-            'BACKEND_',   # Backend-specific
-            'PRODUCTION_', # Production environment
-            'PROD_',      # Short production
-            'API_',       # API-specific
-            'ENV_',       # Environment prefix
-        ]
-    
-    # Case variations to try if not case sensitive
-    case_variations = [var_name]
-    if not case_sensitive:
-        case_variations.extend([
-            var_name.lower(),
-            var_name.upper(), 
-            var_name.title(),
-            var_name.capitalize(),
-            var_name.swapcase(),
-            # Common variations
-            var_name.replace('_', '-'),
-            var_name.replace('-', '_'),
-        ])
+    Returns:
+        Tuple of (lowercased key, original key, value) in environment order
+    """
+    return tuple(
+        (key.lower(), key, value)
+        for key, value in _env_snapshot().items()
+        if value and value.strip()
+    )
+
+
+@lru_cache(maxsize=1)
+def _platform_flags() -> Dict[str, bool]:
+    """
+    Detect the deployment platform from its marker variables.
+    
+    Returns:
+        Dictionary of platform flags (treat as read-only; callers copy it)
+    """
+    return {
+        'is_railway': bool(os.getenv('RAILWAY_PROJECT_ID')),
+        'is_heroku': bool(os.getenv('DYNO')),
+        'is_vercel': bool(os.getenv('VERCEL')),
+        'is_docker': bool(os.getenv('DOCKER_CONTAINER')),
+    }
+
+
+def is_managed_platform() -> bool:
+    """
+    Check whether a deployment platform (Railway, Heroku, Vercel, Docker)
+    is providing the environment.
+    
+    Returns:
+        True if any platform marker variable is set
+    """
+    return any(_platform_flags().values())
+
+
+@lru_cache(maxsize=64)
+def _case_variations(var_name: str, case_sensitive: bool) -> Tuple[str, ...]:
+    """
+    Key spellings to try for a variable name, deduplicated in order.
+    
+    Args:
+        var_name: Base variable name
+        case_sensitive: If True only the name itself is tried
+        
+    Returns:
+        Tuple of candidate spellings
+    """
+    if case_sensitive:
+        return (var_name,)
     
     # Remove duplicates while preserving order
-    case_variations = list(dict.fromkeys(case_variations))
+    return tuple(dict.fromkeys([
+        var_name,
+        var_name.lower(),
+        var_name.upper(),
+        var_name.title(),
+        var_name.capitalize(),
+        var_name.swapcase(),
+        # Common variations
+        var_name.replace('_', '-'),
+        var_name.replace('-', '_'),
+    ]))
+
+
+@lru_cache(maxsize=128)
+def _candidate_keys(var_name: str, prefixes: Tuple[str, ...], case_sensitive: bool) -> Tuple[str, ...]:
+    """
+    Full environment keys to probe for a variable, deduplicated in order.
+    
+    Args:
+        var_name: Base variable name
+        prefixes: Prefixes to try, in priority order
+        case_sensitive: If True only the name itself is tried after each prefix
+        
+    Returns:
+        Tuple of prefixed key spellings
+    """
+    case_variations = _case_variations(var_name, case_sensitive)
+    return tuple(dict.fromkeys(
+        f"{prefix}{case_var}"
+        for prefix in prefixes
+        for case_var in case_variations
+    ))
+
+
+@lru_cache(maxsize=128)
+def _load_env_var_cached(
+    var_name: str, 
+    prefixes: Optional[Tuple[str, ...]],
+    case_sensitive: bool,
+    fallback_value: Optional[str],
+    required: bool
+) -> Optional[str]:
+    """Memoized body of load_env_var_robust (prefixes must be hashable)."""
+    
+    if prefixes is None:
+        prefixes = _DEFAULT_PREFIXES
     
     # Try all combinations of prefixes and case variations
-    for prefix in prefixes:
-        for case_var in case_variations:
-            full_key = f"{prefix}{case_var}"
-            
-            # Try multiple access methods
-            for method in [os.getenv, os.environ.get]:
-                try:
-                    value = method(full_key)
-                    if value and value.strip():  # Check for non-empty strings
-                        logger.debug(f"Found {var_name} as {full_key}")
-                        return value.strip()
-                except Exception as e:
-                    logger.debug(f"Error accessing {full_key}: {e}")
-                    continue
+    environ = _env_snapshot()
+    for full_key in _candidate_keys(var_name, prefixes, case_sensitive):
+        value = environ.get(full_key)
+        if value and value.strip():  # Check for non-empty strings
+            logger.debug(f"Found {var_name} as {full_key}")
+            return value.strip()
     
     # Last resort: fuzzy matching for partial key names
     # This catches cases where Railway might use different naming
     var_name_lower = var_name.lower()
-    for env_key, env_value in os.environ.items():
-        if env_value and env_value.strip():
-            env_key_lower = env_key.lower()
-            
-            # Check if the key contains the main parts of our variable name
-            if (var_name_lower in env_key_lower or 
-                any(part in env_key_lower for part in var_name_lower.split('_') if len(part) > 2)):
-                logger.debug(f"Found {var_name} via fuzzy match: {env_key}")
-                return env_value.strip()
+    name_parts = frozenset(part for part in var_name_lower.split('_') if len(part) > 2)
+    for env_key_lower, env_key, env_value in _lower_env_snapshot():
+        # Check if the key contains the main parts of our variable name
+        if (var_name_lower in env_key_lower or 
+            any(part in env_key_lower for part in name_parts)):
+            logger.debug(f"Found {var_name} via fuzzy match: {env_key}")
+            return env_value.strip()
     
     # If we get here, the variable wasn't found
     if required:
@@ -108,6 +190,39 @@ def load_env_var_robust(
     return fallback_value
 
 
+def load_env_var_robust(
+    var_name: str, 
+    prefixes: Optional[Sequence[str]] = None,
+    case_sensitive: bool = True,
+    fallback_value: Optional[str] = None,
+    required: bool = False
+) -> Optional[str]:
+    """
+    Robust environment variable loader for Railway and other platforms
+    
+    Lookups read a snapshot of the environment taken on first use; call
+    reload_env_keys() after modifying os.environ at runtime.
+    
+    Args:
+        var_name: Base variable name (e.g., 'GROQ_API_KEY')
+        prefixes: Sequence of prefixes to try (e.g., ['RAILWAY_', 'APP_'])
+        case_sensitive: Whether to try case variations
+        fallback_value: Value to return if not found
+        required: Whether this variable is required (logs warning if missing)
+    
+    Returns:
+        The environment variable value if found, fallback_value otherwise
+    """
+    return _load_env_var_cached(
+        var_name,
+        tuple(prefixes) if prefixes is not None else None,
+        case_sensitive,
+        fallback_value,
+        required,
+    )
+
+
+@lru_cache(maxsize=1)
 def load_groq_api_key() -> Optional[str]:
     """Load GROQ API key with Railway-specific handling"""
     return load_env_var_robust(
@@ -127,6 +242,7 @@ def load_groq_api_key() -> Optional[str]:
     )
 
 
+@lru_cache(maxsize=1)
 def load_elevenlabs_api_key() -> Optional[str]:
     """Load ElevenLabs API key with Railway-specific handling"""
     return load_env_var_robust(
@@ -146,6 +262,7 @@ def load_elevenlabs_api_key() -> Optional[str]:
     )
 
 
+@lru_cache(maxsize=1)
 def load_serpapi_key() -> Optional[str]:
     """Load SerpAPI key with Railway-specific handling"""
     return load_env_var_robust(
@@ -166,6 +283,19 @@ def load_serpapi_key() -> Optional[str]:
     )
 
 
+def reload_env_keys() -> None:
+    """
+    Forget cached environment lookups.
+    
+    The API key loaders and the environment snapshots are memoized for the
+    life of the process. Call this after changing os.environ at runtime
+    (e.g. a late load_dotenv()) so the next lookup re-reads it.
+    """
+    for cached in (load_groq_api_key, load_elevenlabs_api_key, load_serpapi_key,
+                   _load_env_var_cached, _env_snapshot, _lower_env_snapshot, _platform_flags):
+        cached.cache_clear()
+
+
 def diagnose_env_vars() -> Dict[str, Any]:
     """
     Diagnose environment variable loading issues
@@ -173,17 +303,18 @@ def diagnose_env_vars() -> Dict[str, Any]:
     Returns:
         Dictionary with diagnostic information
     """
+    # Count Railway and API key variables in a single pass
+    railway_vars = api_key_vars = 0
+    for key in os.environ:
+        railway_vars += key.startswith('RAILWAY_')
+        api_key_vars += 'API_KEY' in key.upper()
+    
     diagnosis = {
-        'platform_info': {
-            'is_railway': bool(os.getenv('RAILWAY_PROJECT_ID')),
-            'is_heroku': bool(os.getenv('DYNO')),
-            'is_vercel': bool(os.getenv('VERCEL')),
-            'is_docker': bool(os.getenv('DOCKER_CONTAINER')),
-        },
+        'platform_info': dict(_platform_flags()),
         'env_var_counts': {
             'total_vars': len(os.environ),
-            'railway_vars': len([k for k in os.environ.keys() if k.startswith('RAILWAY_')]),
-            'api_key_vars': len([k for k in os.environ.keys() if 'API_KEY' in k.upper()]),
+            'railway_vars': railway_vars,
+            'api_key_vars': api_key_vars,
         },
         'api_keys_status': {
             'GROQ_API_KEY': bool(load_groq_api_key()),
@@ -223,13 +354,7 @@ def validate_api_key_format(key: str, key_name: str, expected_prefix: Optional[s
         issues.append(f"{key_name} appears too short (minimum {min_length} characters)")
     
     # Check for placeholder values
-    placeholder_patterns = [
-        'YOUR_', 'your_', 'PLACEHOLDER', 'placeholder', 
-        'REPLACE', 'replace', 'EXAMPLE', 'example',
-        'INSERT', 'insert', 'ADD_HERE', 'add_here'
-    ]
-    
-    if any(pattern in key for pattern in placeholder_patterns):
+    if _PLACEHOLDER_RE.search(key):
         issues.append(f"{key_name} appears to be a placeholder value")
     
     # Check for suspicious patterns
@@ -242,24 +367,30 @@ def validate_api_key_format(key: str, key_name: str, expected_prefix: Optional[s
     return issues
 
 
-def validate_api_keys() -> List[str]:
+def validate_api_keys(keys: Optional[Dict[str, Optional[str]]] = None) -> List[str]:
     """
     Validate API key formats and return list of issues.
     
+    Args:
+        keys: Mapping of key name (e.g. 'GROQ_API_KEY') to value. Loaded
+            from the environment when omitted; pass it to reuse keys the
+            caller already has or to validate without touching os.environ
+    
     Returns:
         List of validation issues (empty if all valid)
     """
+    if keys is None:
+        keys = {
+            "GROQ_API_KEY": load_groq_api_key(),
+            "ELEVENLABS_API_KEY": load_elevenlabs_api_key(),
+            "SERPAPI_API_KEY": load_serpapi_key(),
+        }
+    
     issues = []
     
     # Validate each API key with specific requirements
-    api_keys = [
-        (load_groq_api_key(), "GROQ_API_KEY", "gsk_", 20),
-        (load_elevenlabs_api_key(), "ELEVENLABS_API_KEY", None, 20),
-        (load_serpapi_key(), "SERPAPI_API_KEY", None, 20),
-    ]
-    
-    for key, name, prefix, min_len in api_keys:
-        key_issues = validate_api_key_format(key, name, prefix, min_len)
+    for name, prefix, min_len in _API_KEY_RULES:
+        key_issues = validate_api_key_format(keys.get(name), name, prefix, min_len)
         issues.extend(key_issues)
     
     return issues
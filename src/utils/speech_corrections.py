@@ -5,13 +5,160 @@ Handles common speech-to-text mishearings and provides fuzzy matching for travel
 """
 
 import difflib
+import functools
 import re
-from typing import Dict, List, Tuple, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Pattern, Tuple, Optional
 import logging
 
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, eq=False)
+class _CorrectionTables:
+    """
+    Read-only lookup tables for the travel-term correction passes.
+    
+    Hashed by identity, so using it as a cache key costs nothing and the
+    cache never holds the corrector that built it.
+    """
+    mishearings: Mapping[str, str]
+    exact_re: Pattern
+    phonetic_res: Tuple[Tuple[Pattern, str], ...]
+    single_word_mishearings: Tuple[str, ...]
+    multi_word_mishearings: Tuple[str, ...]
+
+
+def _best_single_word_match(tables: _CorrectionTables, word: str,
+                            confidence_threshold: float) -> Optional[Tuple[str, float]]:
+    """
+    Find the closest single-word mishearing scoring above the threshold
+    
+    Args:
+        tables: Correction tables to search
+        word: Word to match
+        confidence_threshold: Minimum similarity score (exclusive)
+        
+    Returns:
+        Tuple of (mishearing, similarity) or None if nothing scores high enough
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        result = process.extractOne(
+            word,
+            tables.single_word_mishearings,
+            scorer=fuzz.ratio,
+            score_cutoff=confidence_threshold * 100
+        )
+        if result and result[1] > confidence_threshold * 100:
+            return result[0], result[1] / 100
+        return None
+    
+    best = None
+    best_score = confidence_threshold
+    for mishearing in tables.single_word_mishearings:
+        similarity = difflib.SequenceMatcher(None, word, mishearing).ratio()
+        if similarity > best_score:
+            best = mishearing
+            best_score = similarity
+    return (best, best_score) if best else None
+
+
+def _first_phrase_match(tables: _CorrectionTables, text: str,
+                        confidence_threshold: float) -> Optional[Tuple[str, float]]:
+    """
+    Find the first multi-word mishearing resembling the whole text
+    
+    Args:
+        tables: Correction tables to search
+        text: Text to compare against each phrase
+        confidence_threshold: Minimum similarity score (exclusive)
+        
+    Returns:
+        Tuple of (mishearing, similarity) or None if no phrase is close enough
+    """
+    matcher = difflib.SequenceMatcher(None, text)
+    for mishearing in tables.multi_word_mishearings:
+        matcher.set_seq2(mishearing)
+        # Cheap upper bounds first; ratio() only runs when they pass
+        if (matcher.real_quick_ratio() > confidence_threshold and
+                matcher.quick_ratio() > confidence_threshold):
+            similarity = matcher.ratio()
+            if similarity > confidence_threshold:
+                return mishearing, similarity
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _correct_travel_terms(tables: _CorrectionTables, text: str,
+                          confidence_threshold: float) -> Tuple[str, bool, Tuple[str, ...]]:
+    """
+    Run the correction passes on normalized text.
+    
+    Pure in its arguments so results can be cached; the corrections applied
+    are returned rather than logged, letting the caller log every call.
+    
+    Args:
+        tables: Correction tables to apply
+        text: Lower-cased, stripped input text
+        confidence_threshold: Minimum similarity score for fuzzy matching
+        
+    Returns:
+        Tuple of (corrected_text, was_corrected, applied_corrections)
+    """
+    applied: List[str] = []
+    
+    def replace_exact(match: re.Match) -> str:
+        mishearing = match.group(1).lower()
+        correction = tables.mishearings[mishearing]
+        applied.append(f"Applied exact correction: '{mishearing}' -> '{correction}'")
+        return correction
+    
+    # First pass: exact phrase replacements (with word boundaries to avoid substring issues)
+    text, count = tables.exact_re.subn(replace_exact, text)
+    corrected = bool(count)
+    
+    # Second pass: phonetic pattern replacements
+    for regex, replacement in tables.phonetic_res:
+        text, count = regex.subn(replacement, text)
+        if count:
+            corrected = True
+            applied.append(f"Applied pattern correction: '{regex.pattern}' -> '{replacement}'")
+    
+    # Third pass: fuzzy matching for individual words
+    corrected_words = []
+    for word in text.split():
+        best_match = word
+        
+        # Check against all known single-word corrections
+        match = _best_single_word_match(tables, word, confidence_threshold)
+        if match:
+            mishearing, similarity = match
+            best_match = tables.mishearings[mishearing]
+            corrected = True
+            applied.append(f"Applied fuzzy correction: '{word}' -> '{best_match}' (score: {similarity:.2f})")
+        
+        corrected_words.append(best_match)
+    
+    # Fourth pass: multi-word phrase fuzzy matching
+    corrected_text = ' '.join(corrected_words)
+    match = _first_phrase_match(tables, corrected_text, confidence_threshold)
+    if match:
+        mishearing, similarity = match
+        correction = tables.mishearings[mishearing]
+        corrected_text = correction
+        corrected = True
+        applied.append(f"Applied phrase fuzzy correction: '{text}' -> '{correction}' (score: {similarity:.2f})")
+    
+    return corrected_text, corrected, tuple(applied)
+
+
 class TravelTermsCorrector:
     """Corrects common speech recognition errors for travel-related terms"""
     
@@ -81,6 +228,49 @@ class TravelTermsCorrector:
             (r'\bwon wa[wy]\b', 'one way'),
             (r'\bon wa[wy]\b', 'one way'),
         ]
+        
+        # All exact mishearings as one alternation, longest first so that
+        # overlapping phrases resolve to the most specific entry. Tables are
+        # snapshotted here; correct_travel_terms caches results against them
+        self._tables = _CorrectionTables(
+            mishearings=MappingProxyType(dict(self.travel_mishearings)),
+            exact_re=re.compile(
+                r'\b(' + '|'.join(
+                    re.escape(mishearing)
+                    for mishearing in sorted(self.travel_mishearings, key=len, reverse=True)
+                ) + r')\b',
+                re.IGNORECASE
+            ),
+            phonetic_res=tuple(
+                (re.compile(pattern, re.IGNORECASE), replacement)
+                for pattern, replacement in self.phonetic_patterns
+            ),
+            # Single-word mishearings with single-word corrections, the only
+            # candidates the per-word fuzzy pass can apply
+            single_word_mishearings=tuple(
+                mishearing for mishearing, correction in self.travel_mishearings.items()
+                if ' ' not in mishearing and ' ' not in correction
+            ),
+            multi_word_mishearings=tuple(
+                mishearing for mishearing in self.travel_mishearings
+                if len(mishearing.split()) > 1
+            ),
+        )
+        
+        # Trip type subset and patterns for correct_trip_type
+        self._trip_type_terms = {
+            mishearing: correction 
+            for mishearing, correction in self.travel_mishearings.items()
+            if 'trip' in correction or 'way' in correction
+        }
+        self._trip_patterns = [
+            (re.compile(pattern, re.IGNORECASE), replacement)
+            for pattern, replacement in [
+                (r'\b(?:phone|fo+ne?|found?|run|road|ground|brown|sound|bound|pound)\s+trip\b', 'round trip'),
+                (r'\bround\s+(?:chip|dip|grip|strip)\b', 'round trip'),
+                (r'\b(?:one|won|when|on|own)\s+(?:day|we|wa[wy]|weigh|whey|bay|may)\b', 'one way'),
+            ]
+        ]
     
     def correct_travel_terms(self, text: str, confidence_threshold: float = 0.6) -> Tuple[str, bool]:
         """
@@ -93,62 +283,13 @@ class TravelTermsCorrector:
         Returns:
             Tuple of (corrected_text, was_corrected)
         """
-        original_text = text
-        text = text.lower().strip()
-        corrected = False
-        
-        # First pass: exact phrase replacements (with word boundaries to avoid substring issues)
-        for mishearing, correction in self.travel_mishearings.items():
-            # Use word boundary regex to avoid partial matches like "round trip" in "ground trip"  
-            pattern = r'\b' + re.escape(mishearing) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                text = re.sub(pattern, correction, text, flags=re.IGNORECASE)
-                corrected = True
-                logger.info(f"Applied exact correction: '{mishearing}' -> '{correction}'")
-        
-        # Second pass: phonetic pattern replacements
-        for pattern, replacement in self.phonetic_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-                corrected = True
-                logger.info(f"Applied pattern correction: '{pattern}' -> '{replacement}'")
-        
-        # Third pass: fuzzy matching for individual words
-        words = text.split()
-        corrected_words = []
-        
-        for word in words:
-            best_match = word
-            best_score = 0.0
-            
-            # Check against all known corrections
-            for mishearing in self.travel_mishearings.keys():
-                mishearing_words = mishearing.split()
-                
-                # Single word fuzzy matching
-                if len(mishearing_words) == 1:
-                    similarity = difflib.SequenceMatcher(None, word, mishearing_words[0]).ratio()
-                    if similarity > confidence_threshold and similarity > best_score:
-                        correction = self.travel_mishearings[mishearing]
-                        if ' ' not in correction:  # Single word correction
-                            best_match = correction
-                            best_score = similarity
-                            corrected = True
-                            logger.info(f"Applied fuzzy correction: '{word}' -> '{correction}' (score: {similarity:.2f})")
-            
-            corrected_words.append(best_match)
-        
-        # Fourth pass: multi-word phrase fuzzy matching
-        corrected_text = ' '.join(corrected_words)
-        for mishearing, correction in self.travel_mishearings.items():
-            if len(mishearing.split()) > 1:  # Multi-word phrases only
-                similarity = difflib.SequenceMatcher(None, corrected_text, mishearing).ratio()
-                if similarity > confidence_threshold:
-                    corrected_text = correction
-                    corrected = True
-                    logger.info(f"Applied phrase fuzzy correction: '{text}' -> '{correction}' (score: {similarity:.2f})")
-                    break
-        
+        # Results depend only on the tables and the normalized text, so
+        # repeated utterances hit the cache; logging stays per call
+        corrected_text, corrected, applied = _correct_travel_terms(
+            self._tables, text.lower().strip(), confidence_threshold
+        )
+        for message in applied:
+            logger.info(message)
         return corrected_text, corrected
     
     def correct_trip_type(self, text: str) -> Tuple[str, bool]:
@@ -161,36 +302,25 @@ class TravelTermsCorrector:
         Returns:
             Tuple of (corrected_text, was_corrected)
         """
-        # Focus only on trip type corrections
-        trip_type_terms = {
-            mishearing: correction 
-            for mishearing, correction in self.travel_mishearings.items()
-            if 'trip' in correction or 'way' in correction
-        }
-        
-        original_text = text
         text = text.lower().strip()
         corrected = False
         
-        # Exact replacements
-        for mishearing, correction in trip_type_terms.items():
-            if mishearing in text:
-                text = text.replace(mishearing, correction)
+        # Exact replacements (trip type terms only)
+        for mishearing, correction in self._trip_type_terms.items():
+            # replace() hands back the same string when nothing matched, so
+            # the comparison below short-circuits on identity
+            replaced = text.replace(mishearing, correction)
+            if replaced != text:
+                text = replaced
                 corrected = True
                 logger.info(f"Applied trip type correction: '{mishearing}' -> '{correction}'")
         
         # Phonetic patterns for trip types
-        trip_patterns = [
-            (r'\b(?:phone|fo+ne?|found?|run|road|ground|brown|sound|bound|pound)\s+trip\b', 'round trip'),
-            (r'\bround\s+(?:chip|dip|grip|strip)\b', 'round trip'),
-            (r'\b(?:one|won|when|on|own)\s+(?:day|we|wa[wy]|weigh|whey|bay|may)\b', 'one way'),
-        ]
-        
-        for pattern, replacement in trip_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        for regex, replacement in self._trip_patterns:
+            text, count = regex.subn(replacement, text)
+            if count:
                 corrected = True
-                logger.info(f"Applied trip type pattern correction: '{pattern}' -> '{replacement}'")
+                logger.info(f"Applied trip type pattern correction: '{regex.pattern}' -> '{replacement}'")
         
         return text, corrected
     
@@ -210,6 +340,16 @@ class TravelTermsCorrector:
         
         # Get fuzzy matches
         travel_terms = list(self.travel_mishearings.values())
+        if RAPIDFUZZ_AVAILABLE:
+            matches = process.extract(
+                text_lower,
+                travel_terms,
+                scorer=fuzz.ratio,
+                limit=max_suggestions,
+                score_cutoff=40
+            )
+            return [term for term, _score, _index in matches]
+        
         matches = difflib.get_close_matches(
             text_lower, 
             travel_terms, 
@@ -7,13 +7,10 @@ import os
 import sys
 from pathlib import Path
 
-# Load environment variables from .env file
-from dotenv import load_dotenv
-load_dotenv()
-
 # Add project root to Python path for proper imports
 current_dir = Path(__file__).parent.absolute()
-sys.path.insert(0, str(current_dir))
+if str(current_dir) not in sys.path:
+    sys.path.insert(0, str(current_dir))
 
 if __name__ == "__main__":
     import uvicorn